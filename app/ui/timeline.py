@@ -1,15 +1,18 @@
 from __future__ import annotations
-from typing import List, Dict, Optional, Callable
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Callable, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import math
 import os
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QGraphicsView, QGraphicsScene, QHBoxLayout, QPushButton,
     QListWidget, QListWidgetItem, QLabel, QDateEdit, QCheckBox, QSplitter, QDialog,
-    QDialogButtonBox, QMessageBox, QMenu, QGraphicsEllipseItem, QGraphicsTextItem
+    QDialogButtonBox, QMessageBox, QMenu, QGraphicsEllipseItem, QGraphicsSimpleTextItem, QGraphicsItem,
+    QGraphicsPathItem, QGraphicsItemGroup, QGraphicsLineItem, QGraphicsPixmapItem
 )
-from PySide6.QtGui import QColor, QPen, QBrush, QFont, QPixmap, QPainterPath, QPainter, QShortcut, QKeySequence, QGuiApplication
-from PySide6.QtCore import Qt, QRectF, QDate, QSignalBlocker, QSize, Signal, QPointF, QPoint, QTimer
+from PySide6.QtGui import QColor, QPen, QBrush, QFont, QPixmap, QPainterPath, QPainter, QImageReader, QTransform, QFontMetrics, QShortcut, QKeySequence, QGuiApplication, QPixmapCache, QImage
+from PySide6.QtCore import Qt, QRectF, QDate, QSignalBlocker, QSize, Signal, QPointF, QPoint, QTimer, QObject, QRunnable, QThreadPool
 
 from ..models import Event, Character, Place
 
@@ -20,6 +23,12 @@ EVENT_RADIUS = 12
 EVENT_PADDING = 12
 X_STEP_MIN = 210
 
+TEXT_DOC_MARGIN = 4
+BUILD_CHUNK = 50
+# z offset per event index, so overlapping cards stack in event order
+EVENT_Z_STEP = 1e-6
+PIXMAP_CACHE_KB = 256 * 1024
+
 PLACE_PILL_HEIGHT = 36
 PLACE_AVATAR_SIZE = 28
 PLACE_PILL_PADDING = 10
@@ -39,37 +48,134 @@ DESC_COLOR = QColor("#374151")
 CARD_BORDER = QColor(90, 70, 50, 180)
 SHADOW_COLOR = QColor(0, 0, 0, 55)
 CHIP_TEXT = QColor(35, 35, 35)
+INFO_TEXT_COLOR = QColor(80, 80, 90)
+PLACE_TEXT_COLOR = QColor(Qt.black)
+CLUSTER_TEXT_COLOR = QColor(Qt.white)
 
 PLACE_PILL_BG = QColor(255, 255, 255, 230)
 PLACE_PILL_STROKE = QColor(210, 210, 220)
+# Shared pens/brushes for constant styles, so cards don't construct their own.
+NO_PEN = QPen(Qt.NoPen)
+WHITE_BRUSH = QBrush(Qt.white)
+SHADOW_BRUSH = QBrush(SHADOW_COLOR)
+BAND_BRUSH = QBrush(QColor(60, 100, 160, 80))
+THUMB_FRAME_PEN = QPen(QColor(0, 0, 0, 30))
+INFO_PEN = QPen(QColor(120, 120, 130), 1.0)
+INFO_BRUSH = QBrush(QColor(255, 255, 255, 220))
+PANEL_PEN = QPen(PANEL_BORDER)
+PANEL_BRUSH = QBrush(PANEL_COLOR)
+TIMELINE_PEN = QPen(TIMELINE_COLOR, 3)
+TODAY_PEN = QPen(QColor(255, 80, 80, 160), 2)
+PLACE_PILL_PEN = QPen(PLACE_PILL_STROKE)
+PLACE_PILL_BRUSH = QBrush(PLACE_PILL_BG)
+PLACE_AVATAR_PEN = QPen(QColor(0, 0, 0, 20))
+TITLE_PEN = QPen(TITLE_COLOR)
+DATE_PEN = QPen(DATE_COLOR)
+DESC_PEN = QPen(DESC_COLOR)
+
+CLUSTER_W = 56
+CLUSTER_H = 32
+
+
+# Level-of-detail settings, indexed by _lod_bucket(scale_factor).
+_LOD_LEVELS = (
+    {"tick_days": 28, "date_fmt": "%Y-%m", "thumb": 44, "title_mode": "none", "show_date": False, "show_desc": False, "max_chips": 0, "event_w": 220, "event_h": 72, "cluster": True, "fast_thumbs": True},
+    {"tick_days": 7, "date_fmt": "%Y-%m-%d", "thumb": 52, "title_mode": "abbr3", "show_date": True, "show_desc": False, "max_chips": 2, "event_w": 260, "event_h": 86, "cluster": False, "fast_thumbs": False},
+    {"tick_days": 3, "date_fmt": "%Y-%m-%d", "thumb": 68, "title_mode": "full", "show_date": True, "show_desc": True, "max_chips": 4, "event_w": 320, "event_h": 108, "cluster": False, "fast_thumbs": False},
+)
+
+
+def _lod_bucket(scale_factor: float) -> int:
+    if scale_factor < 0.95:
+        return 0
+    elif scale_factor < 1.20:
+        return 1
+    return 2
+
+
+class CrispPathItem(QGraphicsPathItem):
+    """
+    Path item for axis-aligned strokes (grid rows and ticks) that paints
+    without antialiasing, whatever the view's render hints are.
+    Aliased geometry thinner than a device pixel can miss every pixel centre,
+    so `min_width` (the thinnest stroke or rect, in scene units) is checked
+    against the view scale, and below one pixel it is antialiased instead.
+    """
+    def __init__(self, path: QPainterPath, parent: Optional[QGraphicsItem] = None, min_width: float = 1.0):
+        super().__init__(path, parent)
+        self.min_width = min_width
+
+    def paint(self, painter, option, widget=None):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, self.min_width * painter.worldTransform().m11() < 1.0)
+        super().paint(painter, option, widget)
+        painter.restore()
+
+
+def _add_crisp_path(scene: QGraphicsScene, path: QPainterPath, pen: QPen, parent: Optional[QGraphicsItem] = None,
+                    min_width: Optional[float] = None):
+    item = CrispPathItem(path, parent, pen.widthF() if min_width is None else min_width)
+    item.setPen(pen)
+    if parent is None:
+        scene.addItem(item)
+    return item
 
 
-def _add_rounded_rect(scene: QGraphicsScene, rect: QRectF, radius: float, pen: QPen, brush: QBrush):
+def _rounded_rect_path(rect: QRectF, radius: float) -> QPainterPath:
     path = QPainterPath()
     path.addRoundedRect(rect, radius, radius)
-    return scene.addPath(path, pen, brush)
+    return path
 
 
+def _add_rounded_rect(scene: QGraphicsScene, rect: QRectF, radius: float, pen: QPen, brush: QBrush,
+                      parent: Optional[QGraphicsItem] = None):
+    path = _rounded_rect_path(rect, radius)
+    if parent is None:
+        return scene.addPath(path, pen, brush)
+    item = QGraphicsPathItem(path, parent)
+    item.setPen(pen); item.setBrush(brush)
+    return item
+
+
+@lru_cache(maxsize=8192)
 def _parse_date(s: str) -> Optional[datetime]:
     s = (s or "").strip()
     if not s:
         return None
+    # Dates are stored as yyyy-MM-dd; slice that shape directly and only
+    # fall back to strptime for anything hand-edited into data.json.
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+        except ValueError:
+            pass
     try:
         return datetime.strptime(s, "%Y-%m-%d")
     except Exception:
         return None
 
 
-def _elide(text: str, max_chars: int) -> str:
-    if not text:
-        return ""
-    if len(text) <= max_chars:
-        return text
-    return text[: max_chars - 1] + "…"
+@lru_cache(maxsize=4096)
+def _tick_label(d: datetime, fmt: str) -> str:
+    # Panning re-creates the same tick labels over and over; format each once.
+    return d.strftime(fmt)
+
+
+def _qdate_ordinal(qd: QDate) -> int:
+    return qd.toPython().toordinal()
+
 
+def _qdate_from_ordinal(o: int) -> QDate:
+    return QDate(date.fromordinal(o))
 
-def _first_existing_image(paths: List[str]) -> Optional[str]:
-    for p in paths or []:
+
+@lru_cache(maxsize=2048)
+def _first_existing_image(paths: Tuple[str, ...]) -> Optional[str]:
+    """
+    Memoized on the tuple of paths, so refreshes don't stat the same files
+    again; TimelineTab.refresh() clears it when the model changes.
+    """
+    for p in paths:
         if not p:
             continue
         if not os.path.isabs(p):
@@ -79,6 +185,140 @@ def _first_existing_image(paths: List[str]) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=2048)
+def _image_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _image_stamp(paths: Tuple[str, ...]) -> tuple:
+    """The image a card or pill shows for `paths`, and its mtime."""
+    path = _first_existing_image(paths)
+    return (path, _image_mtime(path) if path else None)
+
+
+def _pixmap_key(path: str, w: int, h: int, aspect_mode=Qt.KeepAspectRatio, fast: bool = False) -> Optional[str]:
+    """
+    QPixmapCache key for `path` scaled to w x h, or None if the file is gone.
+    The file's mtime is part of the key so a replaced image is picked up;
+    it is looked up once per TimelineTab.refresh(), not on every pan or zoom.
+    """
+    mtime = _image_mtime(path)
+    if mtime is None:
+        return None
+    return f"{path}|{mtime}|{w}x{h}|{int(aspect_mode.value)}|{int(fast)}"
+
+
+def _decode_scaled(path: str, w: int, h: int, aspect_mode=Qt.KeepAspectRatio, fast: bool = False) -> QImage:
+    """
+    Decode `path` at w x h. Only QImage is used, so this is safe to run
+    outside the GUI thread. With `fast`, the decoder and the fallback scale
+    skip smoothing; used for the zoomed-out view, where the view shrinks the
+    thumbnail further anyway.
+    """
+    # let the decoder produce the target size directly instead of decoding
+    # a full-resolution photo only to shrink it to a thumbnail
+    reader = QImageReader(path)
+    src_size = reader.size()
+    if src_size.isValid():
+        reader.setScaledSize(src_size.scaled(w, h, aspect_mode))
+        if fast:
+            reader.setQuality(0)
+    img = reader.read()
+    if not img.isNull() and src_size.isValid():
+        return img
+    img = QImage(path)
+    if img.isNull():
+        return img
+    return img.scaled(w, h, aspect_mode, Qt.FastTransformation if fast else Qt.SmoothTransformation)
+
+
+def _scaled_pixmap(path: str, w: int, h: int, aspect_mode=Qt.KeepAspectRatio, fast: bool = False) -> QPixmap:
+    """
+    Load `path` scaled to w x h through the global QPixmapCache, so decoded
+    thumbnails survive refreshes and their memory stays bounded.
+    """
+    key = _pixmap_key(path, w, h, aspect_mode, fast)
+    if key is None:
+        return QPixmap()
+    pm = QPixmap()
+    if not QPixmapCache.find(key, pm):
+        img = _decode_scaled(path, w, h, aspect_mode, fast)
+        pm = QPixmap.fromImage(img) if not img.isNull() else QPixmap()
+        if not pm.isNull():
+            QPixmapCache.insert(key, pm)
+    return pm
+
+
+class _ThumbnailSignals(QObject):
+    decoded = Signal(str, QImage)
+
+
+class _ThumbnailJob(QRunnable):
+    """
+    Decode one thumbnail on the thread pool. The image is handed back through
+    `signals`, which lives in the GUI thread, so the QPixmap is made there.
+    """
+    def __init__(self, key: str, path: str, w: int, h: int, fast: bool, signals: _ThumbnailSignals):
+        super().__init__()
+        self.key, self.path, self.w, self.h, self.fast = key, path, w, h, fast
+        self.signals = signals
+
+    def run(self):
+        self.signals.decoded.emit(self.key, _decode_scaled(self.path, self.w, self.h, fast=self.fast))
+
+
+def _cards_offset(old_sig: Optional[tuple], new_sig: tuple) -> Optional[Tuple[float, float]]:
+    """
+    (dx, dy) when the two event signatures only differ by every card having
+    moved by that offset, e.g. after the date range grew; None otherwise.
+    Card geometry is at index 6 of the signature, see _event_signature().
+    """
+    if old_sig is None or old_sig[:6] != new_sig[:6] or old_sig[7:] != new_sig[7:]:
+        return None
+    old_cards, new_cards = old_sig[6], new_sig[6]
+    if not new_cards or len(old_cards) != len(new_cards):
+        return None
+    dx = new_cards[0][1][0] - old_cards[0][1][0]
+    dy = new_cards[0][1][1] - old_cards[0][1][1]
+    for old, new in zip(old_cards, new_cards):
+        for o, n in zip(old, new):
+            if o is None or n is None:
+                if o is not n:
+                    return None
+            elif (abs(n[0] - o[0] - dx) > 1e-6 or abs(n[1] - o[1] - dy) > 1e-6
+                  or n[2] != o[2] or n[3] != o[3]):
+                return None
+    return dx, dy
+
+
+def _rect_intersects(r: tuple, rect: QRectF) -> bool:
+    left, top, w, h = r
+    return left < rect.right() and left + w > rect.left() and top < rect.bottom() and top + h > rect.top()
+
+
+def _layout_cards(x_start: float, x_end: float, slots, event_w: float, event_h: float) -> List[tuple]:
+    """
+    Geometry for one event, one (band, card) entry per (row_idx, stack_idx) slot.
+    Both are plain (left, top, width, height) tuples and band is None for
+    single-day events; no Qt objects are created here.
+    """
+    spans = x_end > x_start
+    rect_left = max(LEFT_MARGIN + 6, x_start)
+    rect_w = max(event_w, x_end - rect_left) if spans else event_w
+    cards = []
+    for row_idx, idx in slots:
+        y_center = TOP_MARGIN + row_idx * ROW_H + ROW_H / 2
+        band = (rect_left, y_center - 6, max(rect_left, x_end) - rect_left, 12) if spans else None
+        top = y_center - event_h / 2
+        if idx:
+            top += (-1)**idx * (min(idx, 3) * 16)
+        cards.append((band, (rect_left, top, rect_w, event_h)))
+    return cards
+
+
 class ClickableEllipseItem(QGraphicsEllipseItem):
     """
     Small clickable ellipse used as an 'info' button inside an event card.
@@ -107,6 +347,54 @@ class ClickableEllipseItem(QGraphicsEllipseItem):
             traceback.print_exc()
 
 
+class ReplayItem(QGraphicsItem):
+    """
+    Paths, rects, pixmaps and text drawn as a single item: the parts are
+    recorded as draw operations while it is built and replayed in paint(),
+    instead of being one item each. Used for the body of an event's cards
+    (bands, shadows, cards, thumbnails and text) and for the grid's date labels.
+    """
+    def __init__(self):
+        super().__init__()
+        self._ops: List[tuple] = []
+        self._bounds = QRectF()
+
+    def _grow(self, rect: QRectF, pen: QPen):
+        m = pen.widthF() / 2 + 1 if pen.style() != Qt.NoPen else 0
+        self._bounds = self._bounds.united(rect.adjusted(-m, -m, m, m))
+
+    def add_path(self, path: QPainterPath, pen: QPen, brush: QBrush):
+        self._ops.append((0, path, pen, brush))
+        self._grow(path.boundingRect(), pen)
+
+    def add_rect(self, rect: QRectF, pen: QPen, brush: QBrush):
+        self._ops.append((1, rect, pen, brush))
+        self._grow(rect, pen)
+
+    def add_pixmap(self, x: float, y: float, pm: QPixmap):
+        self._ops.append((2, QPointF(x, y), pm))
+        self._grow(QRectF(x, y, pm.width(), pm.height()), NO_PEN)
+
+    def add_text(self, x: float, y: float, text: str, font: QFont, fm: QFontMetrics, pen: QPen):
+        self._ops.append((3, QPointF(x, y + fm.ascent()), text, font, pen))
+        self._grow(QRectF(x, y, fm.horizontalAdvance(text), fm.height()), NO_PEN)
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        for op in self._ops:
+            kind = op[0]
+            if kind == 0:
+                painter.setPen(op[2]); painter.setBrush(op[3]); painter.drawPath(op[1])
+            elif kind == 1:
+                painter.setPen(op[2]); painter.setBrush(op[3]); painter.drawRect(op[1])
+            elif kind == 2:
+                painter.drawPixmap(op[1], op[2])
+            else:
+                painter.setFont(op[3]); painter.setPen(op[4]); painter.drawText(op[1], op[2])
+
+
 class PrettyTimelineView(QGraphicsView):
     """
     Non-interactive timeline renderer. Call refresh() to re-draw.
@@ -133,14 +421,96 @@ class PrettyTimelineView(QGraphicsView):
         self.on_event_edited = on_event_edited
 
         self.scene = QGraphicsScene(self)
+        # Items are added/removed in bulk on every refresh and the scene rect is
+        # set explicitly, so maintaining a BSP index only costs time.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
+        if QPixmapCache.cacheLimit() < PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
 
-        self.setRenderHint(QPainter.Antialiasing, True)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
         self.setBackgroundBrush(QBrush(BG_COLOR))
+        # Refreshes swap many small items at once; repainting the whole viewport
+        # is cheaper than working out the dirty region item by item. Every item
+        # sets its own pen/brush, so the per-item painter save/restore is skipped.
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.scale_factor = 1.0
+        self._apply_render_hints()
 
         self._font = QFont("Segoe UI", 10)
+        # per-card fonts and styles, built once instead of for every card
+        self._title_font = QFont(self._font); self._title_font.setPointSize(12); self._title_font.setBold(True)
+        self._date_font = QFont(self._font); self._date_font.setPointSize(10)
+        self._desc_font = QFont(self._font); self._desc_font.setPointSize(10)
+        self._place_font = QFont(self._font.family(), 11)
+        self._today_font = QFont(self._font.family(), 9)
+        self._info_font = QFont(self._font); self._info_font.setPointSize(10); self._info_font.setBold(True)
+        self._tick_color = QColor(120,120,130)
+        self._tick_pen = QPen(self._tick_color)
+        self._today_pen = QPen(QColor(200, 60, 60))
+        self._fm_tick = QFontMetrics(self._font)
+        self._fm_today = QFontMetrics(self._today_font)
+        self._fm_title = QFontMetrics(self._title_font)
+        self._fm_date = QFontMetrics(self._date_font)
+        self._fm_desc = QFontMetrics(self._desc_font)
+        self._fm_place = QFontMetrics(self._place_font)
+        self._card_brush = QBrush(QColor("#EFE7DE"))
+        self._card_pen = QPen(CARD_BORDER, 1.6)
+        self._card_pen_dimmed = QPen(QColor(200,200,205), 1.6)
+        self._card_style_cache: Dict[tuple, Tuple[QPen, QBrush]] = {}
+        self._chip_brush_cache: Dict[Optional[str], QBrush] = {}
+        self._chip_brush_dimmed = QBrush(QColor(150,150,155))
+        self._text_brushes: Dict[int, QBrush] = {}
+        self._cluster_brush = QBrush(TIMELINE_COLOR)
+        # tick lines are filled with a pre-rendered dash tile rather than
+        # stroked with a dashed pen, which is rasterized segment by segment
+        dash_tile = QPixmap(1, 6)
+        dash_tile.fill(Qt.transparent)
+        p = QPainter(dash_tile)
+        p.fillRect(0, 0, 1, 4, AXIS_COLOR)
+        p.end()
+        self._dash_brush = QBrush(dash_tile)
+        self._dash_brush.setTransform(QTransform.fromTranslate(0, TOP_MARGIN - 30))
+        self._cluster_pen = QPen(TIMELINE_COLOR.darker(130), 1.2)
+        self._layout_key = None
+        self._items_by_event_id: Dict[int, List[QGraphicsItem]] = {}
+        self._event_sigs: Dict[int, tuple] = {}
+        self._axis_items: Dict[str, List[QGraphicsItem]] = {}
+        self._axis_signature: Dict[str, tuple] = {}
+        self._culled_rect: Optional[QRectF] = None
+        self._cull_refresh_pending = False
+        self._last_lod_bucket: Optional[int] = None
+        self._data_version = 0
+        self._last_data_version = -1
+        self._last_refresh_sig: Optional[tuple] = None
+        self._pending_builds: List[tuple] = []
+        self._build_ctx = None
+        self._build_timer = QTimer(self)
+        self._build_timer.setSingleShot(True)
+        self._build_timer.setInterval(0)
+        self._build_timer.timeout.connect(self._build_pending)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(80)
+        self._resize_timer.timeout.connect(self._schedule_cull_refresh)
+        # event thumbnails that aren't cached yet are decoded on the thread
+        # pool; the cards waiting for one are rebuilt once it has arrived
+        self._thumb_signals = _ThumbnailSignals()
+        self._thumb_signals.decoded.connect(self._on_thumbnail_decoded)
+        self._thumb_waiting: Dict[str, set] = {}
+        # keys (path + mtime + size) whose decode failed; a changed file gets a new key
+        self._thumb_failed: set = set()
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(30)
+        self._thumb_timer.timeout.connect(self.refresh)
+        # a wheel gesture is many zoom steps; rebuild once it settles
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(40)
+        self._zoom_timer.timeout.connect(self._refresh_if_stale)
         self.setMouseTracking(True)
         self.viewport().setMouseTracking(True)
 
@@ -148,249 +518,602 @@ class PrettyTimelineView(QGraphicsView):
         return QSize(400, 300)
 
     def _lod(self):
-        z = self.scale_factor
-        if z < 0.95:
-            return {"tick_days": 28, "date_fmt": "%Y-%m", "thumb": 44, "title_mode": "none", "show_date": False, "show_desc": False, "max_chips": 0, "event_w": 220, "event_h": 72}
-        elif z < 1.20:
-            return {"tick_days": 7, "date_fmt": "%Y-%m-%d", "thumb": 52, "title_mode": "abbr3", "show_date": True, "show_desc": False, "max_chips": 2, "event_w": 260, "event_h": 86}
-        else:
-            return {"tick_days": 3, "date_fmt": "%Y-%m-%d", "thumb": 68, "title_mode": "full", "show_date": True, "show_desc": True, "max_chips": 4, "event_w": 320, "event_h": 108}
+        return _LOD_LEVELS[_lod_bucket(self.scale_factor)]
+
+    def _apply_render_hints(self):
+        """
+        Antialiasing only pays off when shapes are drawn large enough to see it;
+        in the zoomed-out overview it is just per-pixel painter work.
+        """
+        self.setRenderHint(QPainter.Antialiasing, self.scale_factor >= 1.0)
+        self.setRenderHint(QPainter.TextAntialiasing, self.scale_factor >= 0.75)
 
     def refresh(self):
-        self.scene.clear()
         events: List[Event] = self.get_events_fn()
         characters: List[Character] = self.get_characters_fn()
         places: List[Place] = self.get_places_fn()
 
-        L = self._lod()
-        char_by_name: Dict[str, Character] = {c.name: c for c in characters}
+        bucket = _lod_bucket(self.scale_factor)
+        # Nothing the scene depends on has changed (e.g. Apply with the same
+        # filters, or a zoom step inside the built area): keep it as it is.
+        vr = self.mapToScene(self.viewport().rect()).boundingRect()
+        refresh_sig = (
+            self._data_version, bucket, tuple(map(id, events)), len(characters), len(places),
+            tuple(self.get_selected_chars_fn() or []) if self.get_selected_chars_fn else (),
+            (vr.left(), vr.top(), vr.width(), vr.height()), datetime.today().date(),
+        )
+        if refresh_sig == self._last_refresh_sig:
+            return
+        self._last_refresh_sig = refresh_sig
+        # One repaint once the scene is rebuilt, not one per batch of new items.
+        self.setUpdatesEnabled(False)
+        try:
+            self._rebuild_scene(events, characters, places, bucket)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _rebuild_scene(self, events: List[Event], characters: List[Character], places: List[Place], bucket: int):
+        L = _LOD_LEVELS[bucket]
+        self._last_lod_bucket = bucket
+        self._last_data_version = self._data_version
+        char_color: Dict[str, str] = {c.name: c.color for c in characters}
 
-        dates = []
+        # parse each event's dates once; the placement pass below reuses them
+        parsed = []
+        dmin = dmax = None
         for e in events:
-            s = _parse_date(getattr(e, "start_date", "") or "")
-            if s:
-                dates.append(s)
-            t = _parse_date(getattr(e, "end_date", "") or "")
-            if t:
-                dates.append(t)
-        dates = sorted(dates)
+            s = _parse_date(e.start_date or "")
+            t = _parse_date(e.end_date or "")
+            for d in (s, t):
+                if d:
+                    if dmin is None or d < dmin:
+                        dmin = d
+                    if dmax is None or d > dmax:
+                        dmax = d
+            parsed.append((s, t))
 
         vp_w = max(1000, self.viewport().width())
         vp_h = max(600, self.viewport().height())
 
-        if not places or not dates:
+        if not places or dmin is None:
+            # keep the fingerprint refresh() just set, so an unchanged empty
+            # state is not rebuilt on every refresh
+            refresh_sig = self._last_refresh_sig
+            self._reset_scene()
+            self._last_refresh_sig = refresh_sig
             self.scene.setSceneRect(0, 0, vp_w, vp_h)
             panel_rect = QRectF(20, 20, vp_w - 40, vp_h - 40)
-            _add_rounded_rect(self.scene, panel_rect, 12, QPen(PANEL_BORDER), QBrush(PANEL_COLOR))
-            self.scene.addText("No data to display").setPos(LEFT_MARGIN, TOP_MARGIN)
+            # tracked as an axis layer so the data path below can take it out again
+            self._set_axis_items("empty", (), [
+                _add_rounded_rect(self.scene, panel_rect, 12, PANEL_PEN, PANEL_BRUSH),
+                self._add_simple_text("No data to display", self._font, QColor(Qt.black), (LEFT_MARGIN, TOP_MARGIN)),
+            ])
             return
+        self._clear_axis_items("empty")
 
-        dmin, dmax = min(dates), max(dates)
         dmin = dmin - timedelta(days=1)
         dmax = dmax + timedelta(days=1)
 
         step_px = max(X_STEP_MIN, 140)
 
+        # All dates are whole days, so x is an affine function of the day
+        # ordinal; the placement loop below inlines it.
+        px_per_day = step_px / L["tick_days"]
+        x_offset = LEFT_MARGIN - dmin.toordinal() * px_per_day
+
         def x_for(dt: datetime) -> float:
-            days = (dt - dmin).total_seconds() / 86400.0
-            return LEFT_MARGIN + days * step_px / L["tick_days"]
+            return x_offset + dt.toordinal() * px_per_day
 
         content_w = x_for(dmax) + 220
         content_h = TOP_MARGIN + len(places) * ROW_H + 140
         scene_w = max(content_w + 40, vp_w)
         scene_h = max(content_h + 40, vp_h)
-        self.scene.setSceneRect(0, 0, scene_w, scene_h)
-
-        panel_rect = QRectF(20, 20, scene_w - 40, scene_h - 40)
-        _add_rounded_rect(self.scene, panel_rect, 12, QPen(PANEL_BORDER), QBrush(PANEL_COLOR))
-
         today_dt = datetime.today().date()
-        if dmin.date() <= today_dt <= dmax.date():
-            x_today = x_for(datetime(today_dt.year, today_dt.month, today_dt.day))
-            self.scene.addLine(x_today, TOP_MARGIN - 30, x_today, scene_h - 60, QPen(QColor(255, 80, 80, 160), 2))
-            t = self.scene.addText("Today", QFont(self._font.family(), 9))
-            t.setDefaultTextColor(QColor(200, 60, 60))
-            t.setPos(x_today + 6, TOP_MARGIN - 70)
 
-        for i, p in enumerate(places):
-            y = TOP_MARGIN + i * ROW_H
-            line_y = y + ROW_H / 2
-            self.scene.addLine(LEFT_MARGIN - 10, line_y, scene_w - 60, line_y, QPen(TIMELINE_COLOR, 3))
-            pill_rect = QRectF(20, line_y - (PLACE_PILL_HEIGHT / 2), LEFT_MARGIN - 40, PLACE_PILL_HEIGHT)
-            _add_rounded_rect(self.scene, pill_rect, PLACE_PILL_HEIGHT / 2, QPen(PLACE_PILL_STROKE), QBrush(PLACE_PILL_BG))
-
-            p_img = _first_existing_image(getattr(p, "images", []))
-            name_x = pill_rect.left() + PLACE_PILL_PADDING
-            if p_img:
-                avatar_size = min(PLACE_AVATAR_SIZE, pill_rect.height() - 6)
-                avatar_rect = QRectF(pill_rect.left() + PLACE_PILL_PADDING, pill_rect.top() + (pill_rect.height() - avatar_size) / 2, avatar_size, avatar_size)
-                _add_rounded_rect(self.scene, avatar_rect, avatar_size / 2, QPen(QColor(0,0,0,20)), QBrush(Qt.white))
-                pm = QPixmap(p_img)
-                if not pm.isNull():
-                    inner = avatar_rect.adjusted(3, 3, -3, -3)
-                    pm = pm.scaled(int(inner.width()), int(inner.height()), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    pm_item = self.scene.addPixmap(pm)
-                    pm_item.setPos(inner.left() + (inner.width() - pm.width())/2, inner.top() + (inner.height() - pm.height())/2)
-                    pm_item.setZValue(12)
-                name_x = avatar_rect.right() + 8
-
-            name_item = self.scene.addText(_elide(p.name, 24), QFont(self._font.family(), 11))
-            name_item.setDefaultTextColor(Qt.black)
-            name_item.setPos(name_x, pill_rect.top() + (pill_rect.height() - 14) / 2)
-
-        tick = dmin - timedelta(days=(dmin.weekday() % 7))
-        while tick <= dmax:
-            x = x_for(tick)
-            if x >= LEFT_MARGIN - 5:
-                self.scene.addLine(x, TOP_MARGIN - 30, x, scene_h - 60, QPen(AXIS_COLOR, 1, Qt.DashLine))
-                txt = self.scene.addText(tick.strftime(L["date_fmt"]), self._font)
-                txt.setDefaultTextColor(QColor(120,120,130))
-                txt.setPos(x - 35, TOP_MARGIN - 55)
-            tick += timedelta(days=L["tick_days"])
-
-        selected_chars = set(self.get_selected_chars_fn() or []) if self.get_selected_chars_fn else set()
+        self.scene.setSceneRect(0, 0, scene_w, scene_h)
 
-        stack_map: Dict[tuple, int] = {}
+        # Only build what is in (or just around) the viewport; scrolling
+        # outside of this rect schedules another refresh, see scrollContentsBy.
+        # The margin is one card width / one row, so short pans stay inside it.
+        visible = self.mapToScene(self.viewport().rect()).boundingRect().adjusted(-L["event_w"], -ROW_H, L["event_w"], ROW_H)
+        self._culled_rect = visible
+        rows = range(
+            max(0, int((visible.top() - TOP_MARGIN) // ROW_H)),
+            min(len(places), int((visible.bottom() - TOP_MARGIN) // ROW_H) + 1),
+        )
+        # ticks are evenly spaced, so the visible ones are an index range
+        # rather than a walk over the whole date span
+        first_tick = dmin - timedelta(days=(dmin.weekday() % 7))
+        x0 = x_for(first_tick)
+        lo = max(0, math.ceil((max(LEFT_MARGIN - 5, visible.left()) - x0) / step_px))
+        hi = min((dmax - first_tick).days // L["tick_days"], math.floor((visible.right() - x0) / step_px))
+        ticks = [first_tick + timedelta(days=k * L["tick_days"]) for k in range(lo, hi + 1)]
+
+        # The axes are only rebuilt when what they show changes; the place
+        # pills do not depend on the date range and vice versa.
+        tick_w = self._tick_width()
+        grid_sig = (dmin, dmax, scene_w, scene_h, today_dt, L["tick_days"], L["date_fmt"], rows, tuple(ticks[:1] + ticks[-1:]), tick_w)
+        if grid_sig != self._axis_signature.get("grid"):
+            self._set_axis_items("grid", grid_sig, self._add_grid_items(rows, ticks, L, x_for, dmin, dmax, scene_w, scene_h, today_dt, tick_w))
+        # Card geometry is part of each event's signature, so only a change of
+        # LOD (fonts, visible fields) forces every card to be rebuilt.
+        if bucket != self._layout_key:
+            self._remove_event_items(list(self._items_by_event_id))
+            self._layout_key = bucket
+
+        selected_chars = frozenset(self.get_selected_chars_fn() or ()) if self.get_selected_chars_fn else frozenset()
+        row_idx_by_place: Dict[str, int] = {}
+        for i, p in enumerate(places):
+            row_idx_by_place.setdefault(p.name, i)
 
+        placed = []
         for ev_idx, ev in enumerate(events):
-            sdt = _parse_date(getattr(ev, "start_date", "") or "")
-            edt = _parse_date(getattr(ev, "end_date", "") or "") or sdt
+            sdt, edt = parsed[ev_idx]
             if not sdt:
                 continue
-            if edt < sdt:
+            if not edt or edt < sdt:
                 edt = sdt
+            row_idxs = [row_idx_by_place.get(n) for n in ev.places or [""]]
+            x_start = x_offset + sdt.toordinal() * px_per_day
+            x_end = x_offset + edt.toordinal() * px_per_day if edt > sdt else x_start
+            placed.append((ev_idx, ev, sdt, x_start, x_end, [r for r in row_idxs if r is not None]))
+
+        # At the coarsest LOD, events whose start falls in the same slice of a
+        # row are drawn as one "+N" badge (owned by the first of them) instead
+        # of a stack of unreadable cards.
+        event_w, event_h = L["event_w"], L["event_h"]
+        clusters: Dict[tuple, List[int]] = {}
+        cluster_px = max(12, event_w // 3)
+
+        # A place name may run past its pill up to the first card (or badge)
+        # of its row; it is only elided where it would run into one.
+        name_limits: Dict[int, float] = {}
+        for ev_idx, ev, sdt, x_start, x_end, row_idxs in placed:
+            left = max(LEFT_MARGIN + 6, x_start)
+            if L["cluster"]:
+                left = min(left, LEFT_MARGIN + 6 + ((x_start - LEFT_MARGIN) // cluster_px) * cluster_px)
+            for row_idx in row_idxs:
+                name_limits[row_idx] = min(name_limits.get(row_idx, left), left)
+        limits = tuple(name_limits.get(i, scene_w - 60) - 6 for i in rows)
+        place_sig = (rows, tuple((p.name, _image_stamp(tuple(p.images or ()))) for p in places), limits)
+        if place_sig != self._axis_signature.get("places"):
+            self._set_axis_items("places", place_sig, self._add_place_items(places, rows, limits))
+        if L["cluster"]:
+            for ev_idx, ev, sdt, x_start, x_end, row_idxs in placed:
+                x_bucket = int((x_start - LEFT_MARGIN) // cluster_px)
+                for row_idx in row_idxs:
+                    clusters.setdefault((row_idx, x_bucket), []).append(ev_idx)
 
-            x = x_for(sdt)
-
-            for place_name in getattr(ev, "places", []) or [""]:
-                row_idx = next((i for i, pl in enumerate(places) if pl.name == place_name), None)
-                if row_idx is None:
+        stack_map: Dict[tuple, int] = {}
+        seen_ids = set()
+        pending = []
+
+        for ev_idx, ev, sdt, x_start, x_end, row_idxs in placed:
+            x_bucket = int((x_start - LEFT_MARGIN) // cluster_px)
+
+            slots = []
+            badges = []
+            for row_idx in row_idxs:
+                members = clusters.get((row_idx, x_bucket))
+                if members and len(members) > 1:
+                    if members[0] == ev_idx:
+                        y_center = TOP_MARGIN + row_idx * ROW_H + ROW_H / 2
+                        badge = (LEFT_MARGIN + 6 + x_bucket * cluster_px, y_center - CLUSTER_H / 2, CLUSTER_W, CLUSTER_H)
+                        if _rect_intersects(badge, visible):
+                            badges.append((badge, len(members)))
                     continue
+                day_slot = (row_idx, sdt.date())
+                idx = stack_map.get(day_slot, 0)
+                stack_map[day_slot] = idx + 1
+                slots.append((row_idx, idx))
+
+            cards = [
+                c for c in _layout_cards(x_start, x_end, slots, event_w, event_h)
+                if _rect_intersects(c[1], visible)
+            ]
+
+            ev_id = id(ev)
+            seen_ids.add(ev_id)
+            sig = self._event_signature(ev, cards, selected_chars, char_color) + (tuple(badges),)
+            items = self._items_by_event_id.get(ev_id)
+            old_sig = self._event_sigs.get(ev_id)
+            if items is not None and old_sig == sig:
+                # unchanged card: only its position in the filtered list may have moved
+                self._restack_event_items(items, ev_idx)
+                continue
+            offset = _cards_offset(old_sig, sig) if items and not badges else None
+            if offset is not None:
+                # same cards, shifted (the date range or row order changed): move
+                # the existing items rather than building them again
+                for item in items:
+                    item.moveBy(*offset)
+                self._restack_event_items(items, ev_idx)
+                self._event_sigs[ev_id] = sig
+                continue
+            if items is not None:
+                self._remove_event_items([ev_id])
+            if not cards and not badges:
+                # nothing of it in view: no need to wait for a build chunk
+                self._items_by_event_id[ev_id] = []
+                self._event_sigs[ev_id] = sig
+                continue
+            pending.append((ev_id, ev, ev_idx, cards, badges, sig))
 
-                Lcur = L
-                y_center = TOP_MARGIN + row_idx * ROW_H + ROW_H / 2
+        stale_ids = [ev_id for ev_id in self._items_by_event_id if ev_id not in seen_ids]
+        if stale_ids:
+            self._remove_event_items(stale_ids)
 
-                x_start = x_for(sdt)
-                x_end   = x_for(edt) if edt else x_start
+        # replacing the queue also drops whatever an earlier refresh left unbuilt
+        self._pending_builds = pending
+        self._build_ctx = (L, selected_chars, char_color)
+        self._build_pending()
 
-                if edt and edt > sdt:
-                    band_left  = max(LEFT_MARGIN + 6, x_start)
-                    band_right = max(band_left, x_end)
-                    band_rect  = QRectF(band_left, y_center - 6, band_right - band_left, 12)
-                    self.scene.addRect(band_rect, QPen(Qt.NoPen), QBrush(QColor(60, 100, 160, 80)))
+        self._apply_render_hints()
 
-                min_left   = LEFT_MARGIN + 6
-                min_width  = Lcur["event_w"]
-                rect_left  = max(min_left, x_start)
+    def _build_pending(self):
+        """
+        Add the items for events queued by refresh(), BUILD_CHUNK events at a
+        time; the rest continues from the event loop so a large rebuild does
+        not freeze the window. Events still queued have no items or signature
+        yet, so a newer refresh() simply queues them again.
+        """
+        if not self._pending_builds:
+            return
+        L, selected_chars, char_color = self._build_ctx
+        chunk, self._pending_builds = self._pending_builds[:BUILD_CHUNK], self._pending_builds[BUILD_CHUNK:]
+        for ev_id, ev, ev_idx, cards, badges, sig in chunk:
+            items = self._add_event_items(
+                ev, ev_idx, cards, L, selected_chars, char_color
+            ) + self._add_cluster_items(badges)
+            self._restack_event_items(items, ev_idx)
+            self._items_by_event_id[ev_id] = items
+            self._event_sigs[ev_id] = sig
+        if self._pending_builds:
+            self._build_timer.start()
+
+    @staticmethod
+    def _restack_event_items(items, ev_idx: int):
+        """
+        Point the items at their event's current index. Their z-value gets the
+        index as a fraction, so overlapping cards stack in event order however
+        late each one was (re)built; insertion order would put the newest on top.
+        """
+        for item in items:
+            item.setZValue(math.floor(item.zValue()) + ev_idx * EVENT_Z_STEP)
+            if isinstance(item, ClickableEllipseItem):
+                item.ev_index = ev_idx
 
-                if edt and edt > sdt:
-                    span_w = max(min_width, (x_end - rect_left))
-                    rect_w = span_w
-                else:
-                    rect_w = min_width
+    def _reset_scene(self):
+        self.scene.clear()
+        self._items_by_event_id.clear()
+        self._event_sigs.clear()
+        self._axis_items.clear()
+        self._axis_signature.clear()
+        self._layout_key = None
+        self._culled_rect = None
+        self._last_refresh_sig = None
+        self._pending_builds = []
+
+    def _set_axis_items(self, kind: str, signature: tuple, items: list):
+        self._clear_axis_items(kind)
+        self._axis_items[kind] = items
+        self._axis_signature[kind] = signature
+
+    def _clear_axis_items(self, kind: str):
+        old = self._axis_items.pop(kind, None)
+        self._axis_signature.pop(kind, None)
+        if old:
+            self._remove_items(old)
+
+    def _remove_event_items(self, ev_ids):
+        items = []
+        for ev_id in ev_ids:
+            items.extend(self._items_by_event_id.pop(ev_id, ()))
+            self._event_sigs.pop(ev_id, None)
+        if items:
+            self._remove_items(items)
+
+    def _remove_items(self, items):
+        """
+        Remove a batch of items without letting the scene emit a change
+        notification per item; the viewport is repainted once afterwards.
+        """
+        blocked = self.scene.blockSignals(True)
+        try:
+            for item in items:
+                if item.scene() is self.scene:
+                    self.scene.removeItem(item)
+        finally:
+            self.scene.blockSignals(blocked)
+        self.viewport().update()
+
+    @staticmethod
+    def _event_signature(ev: Event, cards, selected_chars, char_color) -> tuple:
+        chars = tuple(ev.characters or [])
+        return (
+            ev.title, ev.description, ev.start_date, ev.end_date,
+            tuple(ev.images or []), chars, tuple(cards),
+            bool(selected_chars), tuple(n in selected_chars for n in chars),
+            tuple(char_color.get(n) for n in chars),
+            # a card is rebuilt when its image is replaced or (re)appears on disk
+            _image_stamp(tuple(ev.images or ())),
+        )
 
-                rect_h   = Lcur["event_h"]
-                rect     = QRectF(rect_left, y_center - rect_h/2, rect_w, rect_h)
-                day_slot = (row_idx, sdt.date())
-                idx = stack_map.get(day_slot, 0)
-                if idx:
-                    rect.translate(0, (-1)**idx * (min(idx, 3) * 16))
-                stack_map[day_slot] = idx + 1
+    def _add_simple_text(self, text: str, font: QFont, color: QColor, pos,
+                         parent: Optional[QGraphicsItem] = None) -> QGraphicsSimpleTextItem:
+        """
+        Add a single-line label without the QTextDocument that addText() sets up.
+        `pos` is where an addText() item would have been placed; the text is
+        shifted by the document margin so it lands on the same spot.
+        """
+        item = QGraphicsSimpleTextItem(text, parent)
+        item.setFont(font)
+        brush = self._text_brushes.get(color.rgba())
+        if brush is None:
+            brush = self._text_brushes[color.rgba()] = QBrush(color)
+        item.setBrush(brush)
+        item.setPos(pos[0] + TEXT_DOC_MARGIN, pos[1] + TEXT_DOC_MARGIN)
+        if parent is None:
+            self.scene.addItem(item)
+        return item
+
+    def _tick_width(self) -> float:
+        """Width of a tick rect in scene units: one device pixel when zoomed out."""
+        return max(1.0, 1.0 / self.transform().m11())
+
+    def _add_grid_items(self, rows, ticks, L, x_for, dmin, dmax, scene_w, scene_h, today_dt, tick_w=1.0) -> list:
+        """
+        Build the grid as children of one group that is only added to the scene
+        once it is complete, so the scene sees a single insertion per rebuild.
+        The date labels are drawn by one ReplayItem rather than an item each.
+        """
+        layer = QGraphicsItemGroup()
+        # the grid can be rebuilt while cards are kept, so keep it underneath them
+        layer.setZValue(-1)
+
+        panel_rect = QRectF(20, 20, scene_w - 40, scene_h - 40)
+        panel = _add_rounded_rect(self.scene, panel_rect, 12, PANEL_PEN, PANEL_BRUSH, layer)
+        panel.setZValue(-1)
+        labels = ReplayItem()
+        labels.setParentItem(layer)
+        labels.setZValue(1)
+
+        if dmin.date() <= today_dt <= dmax.date():
+            x_today = x_for(datetime(today_dt.year, today_dt.month, today_dt.day))
+            today_line = QGraphicsLineItem(x_today, TOP_MARGIN - 30, x_today, scene_h - 60, layer)
+            today_line.setPen(TODAY_PEN)
+            labels.add_text(x_today + 6 + TEXT_DOC_MARGIN, TOP_MARGIN - 70 + TEXT_DOC_MARGIN, "Today",
+                            self._today_font, self._fm_today, self._today_pen)
+
+        # all row lines, and all tick lines, go into one path item each
+        rows_path = QPainterPath()
+        for i in rows:
+            line_y = TOP_MARGIN + i * ROW_H + ROW_H / 2
+            rows_path.moveTo(LEFT_MARGIN - 10, line_y); rows_path.lineTo(scene_w - 60, line_y)
+        _add_crisp_path(self.scene, rows_path, TIMELINE_PEN, layer)
+
+        tick_path = QPainterPath()
+        for tick in ticks:
+            x = x_for(tick)
+            tick_path.addRect(QRectF(x, TOP_MARGIN - 30, tick_w, scene_h - 60 - (TOP_MARGIN - 30)))
+        ticks_item = _add_crisp_path(self.scene, tick_path, NO_PEN, layer, min_width=tick_w)
+        ticks_item.setBrush(self._dash_brush)
+        for tick in ticks:
+            labels.add_text(x_for(tick) - 35 + TEXT_DOC_MARGIN, TOP_MARGIN - 55 + TEXT_DOC_MARGIN, _tick_label(tick, L["date_fmt"]),
+                            self._font, self._fm_tick, self._tick_pen)
+
+        self.scene.addItem(layer)
+        return [layer]
+
+    def _add_place_items(self, places, rows, limits) -> list:
+        layer = QGraphicsItemGroup()
+        for i, limit in zip(rows, limits):
+            p = places[i]
+            line_y = TOP_MARGIN + i * ROW_H + ROW_H / 2
+            pill_rect = QRectF(20, line_y - (PLACE_PILL_HEIGHT / 2), LEFT_MARGIN - 40, PLACE_PILL_HEIGHT)
+            _add_rounded_rect(self.scene, pill_rect, PLACE_PILL_HEIGHT / 2, PLACE_PILL_PEN, PLACE_PILL_BRUSH, layer)
+
+            p_img = _first_existing_image(tuple(p.images or ()))
+            name_x = pill_rect.left() + PLACE_PILL_PADDING
+            if p_img:
+                avatar_size = min(PLACE_AVATAR_SIZE, pill_rect.height() - 6)
+                avatar_rect = QRectF(pill_rect.left() + PLACE_PILL_PADDING, pill_rect.top() + (pill_rect.height() - avatar_size) / 2, avatar_size, avatar_size)
+                _add_rounded_rect(self.scene, avatar_rect, avatar_size / 2, PLACE_AVATAR_PEN, WHITE_BRUSH, layer)
+                inner = avatar_rect.adjusted(3, 3, -3, -3)
+                pm = _scaled_pixmap(p_img, int(inner.width()), int(inner.height()))
+                if not pm.isNull():
+                    pm_item = QGraphicsPixmapItem(pm, layer)
+                    pm_item.setPos(inner.left() + (inner.width() - pm.width())/2, inner.top() + (inner.height() - pm.height())/2)
+                    pm_item.setZValue(12)
+                name_x = avatar_rect.right() + 8
 
-                shadow = QRectF(rect); shadow.translate(0, 4)
-                _add_rounded_rect(self.scene, shadow, EVENT_RADIUS, QPen(Qt.NoPen), QBrush(SHADOW_COLOR))
-
-                has_sel = bool(selected_chars & set(ev.characters or []))
-                if ev.characters:
-                    try:
-                        base_col = QColor(char_by_name.get(ev.characters[0], Character(name="", color="#9aa")).color)
-                    except Exception:
-                        base_col = QColor("#9aa")
-                    bg = QColor(base_col); bg.setAlpha(200 if (not selected_chars or has_sel) else 90)
-                    border = QColor(base_col.darker(140)) if (not selected_chars or has_sel) else QColor(180,180,185)
-                else:
-                    bg = QColor("#EFE7DE")
-                    border = CARD_BORDER if (not selected_chars) else QColor(200,200,205)
-
-                _add_rounded_rect(self.scene, rect, EVENT_RADIUS, QPen(border, 1.6), QBrush(bg))
-
-                padding   = EVENT_PADDING
-                chip_zone = min(int(rect.width() * 0.35), 140)
-                text_left = rect.left() + padding
-                text_right = rect.right() - (padding + 8 + chip_zone)
-                text_width = max(10, int(text_right - text_left))
-
-                base_y   = rect.top() + 10
-                next_y   = base_y
-
-                thumb_path = _first_existing_image(getattr(ev, "images", []))
-                if thumb_path and L.get("thumb", 0) > 0:
-                    frame = QRectF(rect.left() + padding, rect.top() + (L["event_h"] - L["thumb"]) / 2, L["thumb"], L["thumb"])
-                    _add_rounded_rect(self.scene, frame, 8, QPen(QColor(0,0,0,30)), QBrush(Qt.white))
-                    pm = QPixmap(thumb_path)
-                    if not pm.isNull():
-                        inner = frame.adjusted(4,4,-4,-4)
-                        pm = pm.scaled(int(inner.width()), int(inner.height()), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        pmi = self.scene.addPixmap(pm)
-                        pmi.setPos(inner.left() + (inner.width() - pm.width())/2, inner.top() + (inner.height() - pm.height())/2)
-                    text_left = frame.right() + 10
-                    text_width = max(10, int(text_right - text_left))
-
-                title_font = QFont(self._font); title_font.setPointSize(12); title_font.setBold(True)
-                t_item = self.scene.addText(_elide(ev.title or "", 40), title_font)
-                t_item.setDefaultTextColor(TITLE_COLOR)
-                t_item.setPos(text_left, next_y)
-                next_y += 22
-
-                if Lcur.get("show_date", False):
-                    date_font = QFont(self._font); date_font.setPointSize(10)
-                    date_text = f"{ev.start_date} – {ev.end_date}" if ev.end_date else (ev.start_date or "")
-                    d_item = self.scene.addText(_elide(date_text, 40), date_font)
-                    d_item.setDefaultTextColor(DATE_COLOR)
-                    d_item.setPos(text_left, next_y)
-                    next_y += 18
-
-                if Lcur.get("show_desc", False):
-                    desc_font = QFont(self._font); desc_font.setPointSize(10)
-                    desc_item = self.scene.addText(_elide(ev.description or "", 120), desc_font)
-                    desc_item.setDefaultTextColor(DESC_COLOR)
-                    desc_item.setPos(text_left, next_y)
-                    next_y += 18
+            name_pos = (name_x, pill_rect.top() + (pill_rect.height() - 14) / 2)
+            name_w = max(10, int(max(pill_rect.right() - PLACE_PILL_PADDING, limit) - name_x - TEXT_DOC_MARGIN))
+            name = self._fm_place.elidedText(p.name or "", Qt.ElideRight, name_w)
+            self._add_simple_text(name, self._place_font, PLACE_TEXT_COLOR, name_pos, layer)
+        self.scene.addItem(layer)
+        return [layer]
 
+    def _add_event_items(self, ev: Event, ev_idx: int, cards, L, selected_chars, char_color) -> list:
+        """
+        Build the items for one event from its precomputed card geometry
+        (see _layout_cards) and return them so the card can be removed later.
+        The card bodies are drawn by one ReplayItem; chips and the info
+        button stay separate items so their z-values still lift them above
+        neighbouring cards.
+        """
+        if not cards:
+            return []
+        body = ReplayItem()
+        # panning then only blits the card; a zoom step re-renders it once
+        body.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        items = [body]
+        ev_chars = ev.characters or []
+        has_sel = any(c in selected_chars for c in ev_chars)
+        if ev_chars:
+            card_pen, card_brush = self._char_card_style(char_color.get(ev_chars[0], "#9aa"), not selected_chars or has_sel)
+        else:
+            card_pen = self._card_pen if not selected_chars else self._card_pen_dimmed
+            card_brush = self._card_brush
+        thumb_path = _first_existing_image(tuple(ev.images or ()))
+        date_text = f"{ev.start_date} – {ev.end_date}" if ev.end_date else (ev.start_date or "")
+        chip_names = ev_chars[:L.get("max_chips", 3)]
+        # the chips share the title's line, so only the title makes room for them
+        chip_zone = len(chip_names) * (DEFAULT_CHAR_AVATAR + AVATAR_SPACING)
+        thumb_sz = L.get("thumb", 0) if thumb_path else 0
+        show_date = L.get("show_date", False)
+        show_desc = L.get("show_desc", False)
+
+        for band, card in cards:
+            if band:
+                body.add_rect(QRectF(*band), NO_PEN, BAND_BRUSH)
+
+            rect = QRectF(*card)
+            shadow = QRectF(rect); shadow.translate(0, 4)
+            body.add_path(_rounded_rect_path(shadow, EVENT_RADIUS), NO_PEN, SHADOW_BRUSH)
+            body.add_path(_rounded_rect_path(rect, EVENT_RADIUS), card_pen, card_brush)
+
+            padding   = EVENT_PADDING
+            text_left = rect.left() + padding
+            text_right = rect.right() - padding
+
+            base_y   = rect.top() + 10
+            next_y   = base_y
+
+            if thumb_sz > 0:
+                frame = QRectF(rect.left() + padding, rect.top() + (rect.height() - thumb_sz) / 2, thumb_sz, thumb_sz)
+                body.add_path(_rounded_rect_path(frame, 8), THUMB_FRAME_PEN, WHITE_BRUSH)
+                inner = frame.adjusted(4,4,-4,-4)
+                pm = self._event_thumbnail(ev, thumb_path, int(inner.width()), int(inner.height()), L["fast_thumbs"])
+                if not pm.isNull():
+                    body.add_pixmap(inner.left() + (inner.width() - pm.width())/2, inner.top() + (inner.height() - pm.height())/2, pm)
+                text_left = frame.right() + 10
+            text_width = max(10, int(text_right - text_left - TEXT_DOC_MARGIN))
+            title_width = max(10, text_width - chip_zone)
+
+            text_x = text_left + TEXT_DOC_MARGIN
+            body.add_text(text_x, next_y + TEXT_DOC_MARGIN, self._fm_title.elidedText(ev.title or "", Qt.ElideRight, title_width),
+                          self._title_font, self._fm_title, TITLE_PEN)
+            next_y += 22
+
+            if show_date:
+                body.add_text(text_x, next_y + TEXT_DOC_MARGIN, self._fm_date.elidedText(date_text, Qt.ElideRight, text_width),
+                              self._date_font, self._fm_date, DATE_PEN)
+                next_y += 18
+
+            if show_desc:
+                body.add_text(text_x, next_y + TEXT_DOC_MARGIN, self._fm_desc.elidedText(ev.description or "", Qt.ElideRight, text_width),
+                              self._desc_font, self._fm_desc, DESC_PEN)
+                next_y += 18
+
+            if chip_names:
+                # one group carries the z-value for all of the card's chips
+                chips = QGraphicsItemGroup()
+                chips.setZValue(40)
                 cx = rect.right() - padding - DEFAULT_CHAR_AVATAR
                 cy = rect.top() + 10
-                for name in (ev.characters or [])[:Lcur.get("max_chips", 3)]:
-                    ch = char_by_name.get(name, None)
-                    col = QColor("#888")
-                    if ch:
-                        try:
-                            col = QColor(ch.color)
-                        except Exception:
-                            pass
+                for name in chip_names:
                     if selected_chars and name not in selected_chars:
-                        col = QColor(150,150,155)
-                    circ = self.scene.addEllipse(cx - DEFAULT_CHAR_AVATAR, cy, DEFAULT_CHAR_AVATAR, DEFAULT_CHAR_AVATAR, QPen(Qt.NoPen), QBrush(col))
-                    circ.setZValue(40)
+                        chip_brush = self._chip_brush_dimmed
+                    else:
+                        chip_brush = self._char_chip_brush(char_color.get(name))
+                    circ = QGraphicsEllipseItem(cx - DEFAULT_CHAR_AVATAR, cy, DEFAULT_CHAR_AVATAR, DEFAULT_CHAR_AVATAR, chips)
+                    circ.setPen(NO_PEN); circ.setBrush(chip_brush)
                     cx -= (DEFAULT_CHAR_AVATAR + AVATAR_SPACING)
-
-                info_size = 16
-                info_x = rect.left() + 8
-                info_y = rect.bottom() - info_size - 8
-                info_rect = QRectF(info_x, info_y, info_size, info_size)
-                info_item = ClickableEllipseItem(info_rect, ev_idx, self._on_info_clicked)
-                info_item.setZValue(80)
-                info_item.setBrush(QBrush(QColor(255, 255, 255, 220)))
-                info_item.setPen(QPen(QColor(120, 120, 130), 1.0))
-                self.scene.addItem(info_item)
-                i_text = QGraphicsTextItem("i")
-                font_i = QFont(self._font)
-                font_i.setPointSize(10)
-                font_i.setBold(True)
-                i_text.setFont(font_i)
-                i_text.setDefaultTextColor(QColor(80, 80, 90))
-                i_text.setPos(info_x + 4, info_y - 1)
-                i_text.setZValue(81)
-                self.scene.addItem(i_text)
+                self.scene.addItem(chips)
+                items.append(chips)
+
+            info_size = 16
+            info_x = rect.left() + 8
+            info_y = rect.bottom() - info_size - 8
+            info_rect = QRectF(info_x, info_y, info_size, info_size)
+            info_item = ClickableEllipseItem(info_rect, ev_idx, self._on_info_clicked)
+            info_item.setZValue(80)
+            info_item.setBrush(INFO_BRUSH)
+            info_item.setPen(INFO_PEN)
+            self.scene.addItem(info_item)
+            items.append(info_item)
+            i_text = self._add_simple_text("i", self._info_font, INFO_TEXT_COLOR, (info_x + 4, info_y - 1))
+            i_text.setZValue(81)
+            items.append(i_text)
+
+        self.scene.addItem(body)
+        return items
+
+    def _event_thumbnail(self, ev: Event, path: str, w: int, h: int, fast: bool) -> QPixmap:
+        """
+        The cached thumbnail, or a null pixmap while it is being decoded in the
+        background; the card shows its empty frame until then.
+        """
+        key = _pixmap_key(path, w, h, fast=fast)
+        pm = QPixmap()
+        if key is None or key in self._thumb_failed or QPixmapCache.find(key, pm):
+            return pm
+        waiting = self._thumb_waiting.get(key)
+        if waiting is None:
+            waiting = self._thumb_waiting[key] = set()
+            QThreadPool.globalInstance().start(_ThumbnailJob(key, path, w, h, fast, self._thumb_signals))
+        waiting.add(id(ev))
+        return pm
+
+    def _on_thumbnail_decoded(self, key: str, img: QImage):
+        ev_ids = self._thumb_waiting.pop(key, ())
+        if img.isNull():
+            # don't queue the same unreadable file again on every rebuild
+            self._thumb_failed.add(key)
+            return
+        QPixmapCache.insert(key, QPixmap.fromImage(img))
+        # drop the signatures so the next refresh rebuilds these cards
+        for ev_id in ev_ids:
+            self._event_sigs.pop(ev_id, None)
+        self._last_refresh_sig = None
+        self._thumb_timer.start()
+
+    def _char_card_style(self, color_hex, active: bool) -> Tuple[QPen, QBrush]:
+        """
+        Card pen and brush for a character colour, built once per colour and
+        selection state; character palettes are small and shared by many cards.
+        """
+        key = (color_hex, active)
+        style = self._card_style_cache.get(key)
+        if style is None:
+            try:
+                base_col = QColor(color_hex)
+            except Exception:
+                base_col = QColor("#9aa")
+            bg = QColor(base_col); bg.setAlpha(200 if active else 90)
+            border = QColor(base_col.darker(140)) if active else QColor(180,180,185)
+            style = self._card_style_cache[key] = (QPen(border, 1.6), QBrush(bg))
+        return style
+
+    def _char_chip_brush(self, color_hex) -> QBrush:
+        brush = self._chip_brush_cache.get(color_hex)
+        if brush is None:
+            col = QColor("#888")
+            if color_hex is not None:
+                try:
+                    col = QColor(color_hex)
+                except Exception:
+                    pass
+            brush = self._chip_brush_cache[color_hex] = QBrush(col)
+        return brush
+
+    def _add_cluster_items(self, badges) -> list:
+        items = []
+        for badge, count in badges:
+            rect = QRectF(*badge)
+            pill = _add_rounded_rect(self.scene, rect, CLUSTER_H / 2, self._cluster_pen, self._cluster_brush)
+            pill.setZValue(30)
+            items.append(pill)
+            label = f"+{count}"
+            label_pos = (
+                rect.center().x() - self._fm_title.horizontalAdvance(label) / 2 - TEXT_DOC_MARGIN,
+                rect.center().y() - self._fm_title.height() / 2 - TEXT_DOC_MARGIN,
+            )
+            text = self._add_simple_text(label, self._title_font, CLUSTER_TEXT_COLOR, label_pos)
+            text.setZValue(31)
+            items.append(text)
+        return items
 
     def _on_info_clicked(self, ev_index: int, scene_pos: QPointF):
         """
@@ -473,13 +1196,7 @@ class PrettyTimelineView(QGraphicsView):
         layout.addWidget(btns)
         if dlg.exec() == QDialog.Accepted:
             ev.characters = [i.text() for i in listw.selectedItems()]
-            # refresh and notify
-            self.refresh()
-            if callable(self.on_event_edited):
-                try:
-                    self.on_event_edited()
-                except Exception:
-                    pass
+            self._event_edited()
 
     def _edit_places(self, ev_index: int):
         events = self.get_events_fn()
@@ -506,12 +1223,7 @@ class PrettyTimelineView(QGraphicsView):
         layout.addWidget(btns)
         if dlg.exec() == QDialog.Accepted:
             ev.places = [i.text() for i in listw.selectedItems()]
-            self.refresh()
-            if callable(self.on_event_edited):
-                try:
-                    self.on_event_edited()
-                except Exception:
-                    pass
+            self._event_edited()
 
     def _edit_dates(self, ev_index: int):
         events = self.get_events_fn()
@@ -528,7 +1240,7 @@ class PrettyTimelineView(QGraphicsView):
         if ev.start_date:
             d = _parse_date(ev.start_date)
             if d:
-                start_edit.setDate(QDate.fromString(d.strftime("%Y-%m-%d"), "yyyy-MM-dd"))
+                start_edit.setDate(QDate(d.year, d.month, d.day))
             else:
                 start_edit.setDate(today)
         else:
@@ -536,7 +1248,7 @@ class PrettyTimelineView(QGraphicsView):
         if ev.end_date:
             d2 = _parse_date(ev.end_date)
             if d2:
-                end_edit.setDate(QDate.fromString(d2.strftime("%Y-%m-%d"), "yyyy-MM-dd"))
+                end_edit.setDate(QDate(d2.year, d2.month, d2.day))
             else:
                 end_edit.setDate(start_edit.date())
         else:
@@ -557,30 +1269,90 @@ class PrettyTimelineView(QGraphicsView):
                 return
             ev.start_date = s.toString("yyyy-MM-dd")
             ev.end_date = t.toString("yyyy-MM-dd")
-            self.refresh()
-            if callable(self.on_event_edited):
-                try:
-                    self.on_event_edited()
-                except Exception:
-                    pass
+            self._event_edited()
 
     def zoom_in(self):
         step = 1.25
         self.scale(step, step)
         self.scale_factor *= step
-        self.refresh()
+        self._apply_render_hints()
+        self._zoom_timer.start()
 
     def zoom_out(self):
         step = 1.25
         self.scale(1/step, 1/step)
         self.scale_factor /= step
-        self.refresh()
+        self._apply_render_hints()
+        self._zoom_timer.start()
 
     def reset_zoom(self):
+        if self.scale_factor == 1.0 and self.transform().isIdentity():
+            return
         self.resetTransform()
         self.scale_factor = 1.0
+        self._apply_render_hints()
+        self._zoom_timer.stop()
+        self._refresh_if_stale()
+
+    def invalidate(self):
+        """
+        Mark the model as changed, so the next zoom step rebuilds even when it
+        stays within the same level of detail.
+        """
+        self._data_version += 1
+
+    def _event_edited(self):
+        """
+        Redraw after an event was edited in place. The owner's on_event_edited
+        callback does the one refresh (its filters have to see the edit first);
+        without one, invalidate the fingerprint, since the event objects are
+        the same, and refresh here. Only the edited event's items are rebuilt.
+        """
+        if callable(self.on_event_edited):
+            try:
+                self.on_event_edited()
+            except Exception:
+                pass
+        else:
+            self.invalidate()
+            self.refresh()
+
+    def _refresh_if_stale(self):
+        """
+        Zooming is a view transform; the scene only has to be rebuilt when the
+        LOD bucket changed, the data changed since the last refresh(), or the
+        ticks have to be widened to stay a device pixel wide.
+        """
+        if (_lod_bucket(self.scale_factor) != self._last_lod_bucket or self._data_version != self._last_data_version
+                or self._tick_width() != self._axis_signature.get("grid", (None,))[-1]):
+            self.refresh()
+        else:
+            self._schedule_cull_refresh()
+
+    def _schedule_cull_refresh(self):
+        """
+        refresh() only builds items around the viewport; once the viewport has
+        moved outside that area, rebuild on the next event loop pass.
+        """
+        if self._cull_refresh_pending or self._culled_rect is None:
+            return
+        if self._culled_rect.contains(self.mapToScene(self.viewport().rect()).boundingRect()):
+            return
+        self._cull_refresh_pending = True
+        QTimer.singleShot(0, self._cull_refresh)
+
+    def _cull_refresh(self):
+        self._cull_refresh_pending = False
         self.refresh()
 
+    def scrollContentsBy(self, dx: int, dy: int):
+        super().scrollContentsBy(dx, dy)
+        self._schedule_cull_refresh()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+
     def wheelEvent(self, event):
         if event.modifiers() & Qt.ControlModifier:
             if event.angleDelta().y() > 0:
@@ -600,6 +1372,12 @@ class TimelineTab(QWidget):
         self._get_events_raw = get_events_fn
         self._get_characters = get_characters_fn
         self._get_places = get_places_fn
+        self._idx_events: Optional[List[Event]] = None
+        self._idx_start: List[Optional[int]] = []
+        self._idx_chars: List[frozenset] = []
+        self._idx_places: List[frozenset] = []
+        self._idx_by_start: List[int] = []
+        self._model_sig: Optional[tuple] = None
 
         self.char_filter = QListWidget(); self.char_filter.setSelectionMode(QListWidget.MultiSelection)
         self.place_filter = QListWidget(); self.place_filter.setSelectionMode(QListWidget.MultiSelection)
@@ -650,14 +1428,22 @@ class TimelineTab(QWidget):
         QShortcut(QKeySequence("Ctrl+0"), self, activated=self.graph.reset_zoom)
 
         self._populate_filters()
+        # synchronous, so a refresh() straight after construction (MainWindow
+        # does one) already filters with the real range; the index makes it cheap
         self._init_date_defaults()
 
         self.apply_btn.clicked.connect(self.refresh)
         self.clear_btn.clicked.connect(self._clear_filters)
         self.zoomin_btn.clicked.connect(self.graph.zoom_in)
         self.zoomout_btn.clicked.connect(self.graph.zoom_out)
-        self.char_filter.itemSelectionChanged.connect(self._maybe_auto_dates)
-        self.place_filter.itemSelectionChanged.connect(self._maybe_auto_dates)
+        # a range-select emits one selection change per item; only re-run
+        # auto dates (and its refresh) once the selection has settled
+        self._auto_dates_timer = QTimer(self)
+        self._auto_dates_timer.setSingleShot(True)
+        self._auto_dates_timer.setInterval(80)
+        self._auto_dates_timer.timeout.connect(self._maybe_auto_dates)
+        self.char_filter.itemSelectionChanged.connect(self._auto_dates_timer.start)
+        self.place_filter.itemSelectionChanged.connect(self._auto_dates_timer.start)
 
         self.graph.refresh()
 
@@ -671,16 +1457,49 @@ class TimelineTab(QWidget):
             for p in self._get_places():
                 self.place_filter.addItem(QListWidgetItem(p.name))
 
-    def _init_date_defaults(self):
-        dts = [_parse_date(e.start_date) for e in self._get_events_raw() if e.start_date]
-        dts = [d for d in dts if d]
-        today = QDate.currentDate()
+    def _rebuild_event_index(self):
+        """
+        Snapshot the fields the filters look at, one list per field: start dates
+        as day ordinals (None when unparseable) and characters/places as frozensets.
+        _idx_by_start holds the dated event indices in start order, so the date
+        range is read off its ends. Rebuilt on refresh(), so filtering and auto
+        dates don't re-parse every event.
+        """
+        events = list(self._get_events_raw())
+        starts = []
+        for e in events:
+            d = _parse_date(e.start_date)
+            starts.append(d.toordinal() if d else None)
+        self._idx_events = events
+        self._idx_start = starts
+        self._idx_chars = [frozenset(e.characters or ()) for e in events]
+        self._idx_places = [frozenset(e.places or ()) for e in events]
+        self._idx_by_start = sorted((i for i, o in enumerate(starts) if o is not None), key=starts.__getitem__)
+
+    def _event_index(self) -> List[Event]:
+        if self._idx_events is None:
+            self._rebuild_event_index()
+        return self._idx_events
+
+    def _invalidate_event_index(self):
+        self._idx_events = None
+
+    def _set_date_range(self, mn: Optional[int], mx: Optional[int]):
         with QSignalBlocker(self.date_from), QSignalBlocker(self.date_to):
-            if not dts:
+            if mn is None:
+                today = QDate.currentDate()
                 self.date_from.setDate(today); self.date_to.setDate(today)
             else:
-                self.date_from.setDate(QDate.fromString(min(dts).strftime("%Y-%m-%d"), "yyyy-MM-dd"))
-                self.date_to.setDate(QDate.fromString(max(dts).strftime("%Y-%m-%d"), "yyyy-MM-dd"))
+                self.date_from.setDate(_qdate_from_ordinal(mn))
+                self.date_to.setDate(_qdate_from_ordinal(mx))
+
+    def _init_date_defaults(self):
+        self._event_index()
+        order, starts = self._idx_by_start, self._idx_start
+        if order:
+            self._set_date_range(starts[order[0]], starts[order[-1]])
+        else:
+            self._set_date_range(None, None)
 
     def _selected_chars(self) -> List[str]:
         return [i.text() for i in self.char_filter.selectedItems()]
@@ -688,49 +1507,39 @@ class TimelineTab(QWidget):
     def _selected_places(self) -> List[str]:
         return [i.text() for i in self.place_filter.selectedItems()]
 
-    def _within_dates(self, ev: Event) -> bool:
-        if not ev.start_date:
-            return False
-        s = _parse_date(ev.start_date)
-        if not s:
-            return False
-        f = _parse_date(self.date_from.date().toString("yyyy-MM-dd"))
-        t = _parse_date(self.date_to.date().toString("yyyy-MM-dd"))
-        if f and s < f:
-            return False
-        if t and s > t:
-            return False
-        return True
-
     def _get_events_filtered(self) -> List[Event]:
-        events = self._get_events_raw()
+        events = self._event_index()
         sel_places = set(self._selected_places())
+        lo = _qdate_ordinal(self.date_from.date())
+        hi = _qdate_ordinal(self.date_to.date())
+        starts, places = self._idx_start, self._idx_places
 
-        def place_ok(e: Event): return True if not sel_places else bool(set(e.places) & sel_places)
-
-        return [e for e in events if self._within_dates(e) and place_ok(e)]
+        return [
+            events[i] for i, o in enumerate(starts)
+            if o is not None and lo <= o <= hi and (not sel_places or not places[i].isdisjoint(sel_places))
+        ]
 
     def _maybe_auto_dates(self):
         if not self.auto_dates.isChecked():
             return
-        events = self._get_events_raw()
+        self._event_index()
         sel_chars = set(self._selected_chars())
         sel_places = set(self._selected_places())
-        dts: List[datetime] = []
-        for e in events:
-            d = _parse_date(e.start_date)
-            if not d:
-                continue
-            if (not sel_chars or set(e.characters) & sel_chars) and (not sel_places or set(e.places) & sel_places):
-                dts.append(d)
-        with QSignalBlocker(self.date_from), QSignalBlocker(self.date_to):
-            if dts:
-                self.date_from.setDate(QDate.fromString(min(dts).strftime("%Y-%m-%d"), "yyyy-MM-dd"))
-                self.date_to.setDate(QDate.fromString(max(dts).strftime("%Y-%m-%d"), "yyyy-MM-dd"))
-            else:
-                today = QDate.currentDate()
-                self.date_from.setDate(today)
-                self.date_to.setDate(today)
+        chars, places, starts = self._idx_chars, self._idx_places, self._idx_start
+
+        def matches(i):
+            return ((not sel_chars or not chars[i].isdisjoint(sel_chars))
+                    and (not sel_places or not places[i].isdisjoint(sel_places)))
+
+        # walk the start-ordered index in from both ends; the first match on
+        # each side is the range, so most toggles stop after a few events
+        order = self._idx_by_start
+        first = next((i for i in order if matches(i)), None)
+        if first is None:
+            self._set_date_range(None, None)
+        else:
+            last = next(i for i in reversed(order) if matches(i))
+            self._set_date_range(starts[first], starts[last])
         self.graph.refresh()
 
     def _clear_filters(self):
@@ -739,8 +1548,29 @@ class TimelineTab(QWidget):
         self._init_date_defaults()
         self.refresh()
 
+    def _model_signature(self) -> tuple:
+        return (
+            tuple((e.title, e.description, e.start_date, e.end_date, tuple(e.images or ()),
+                   tuple(e.characters or ()), tuple(e.places or ())) for e in self._get_events_raw()),
+            tuple((c.name, c.color) for c in self._get_characters()),
+            tuple((p.name, tuple(p.images or ())) for p in self._get_places()),
+        )
+
     def refresh(self):
         self._populate_filters()
+        # Image files can change on disk without the model changing, so the
+        # file lookups are only cached until the next refresh; the card and
+        # pill signatures include them, so a replaced image is redrawn.
+        _first_existing_image.cache_clear()
+        _image_mtime.cache_clear()
+        # Apply and the tabs' data_changed signals land here even when nothing
+        # the timeline shows has changed; only drop the index when it has,
+        # otherwise the view's own fingerprint decides what to redraw.
+        sig = self._model_signature()
+        if sig != self._model_sig:
+            self._model_sig = sig
+            self._rebuild_event_index()
+            self.graph.invalidate()
         self.graph.refresh()
 
     def _on_event_edited(self):
@@ -749,6 +1579,8 @@ class TimelineTab(QWidget):
         Emit data_changed so MainWindow (or whoever listens) can save the state.
         Also refresh the timeline to reflect changes.
         """
+        # the event was changed in place, so the index no longer matches it
+        self._invalidate_event_index()
         try:
             self.refresh()
         finally: